@@ -1,56 +1,236 @@
+import asyncio
+import hashlib
 import json
+import os
+import sys
 import bcrypt
-from typing import Optional, List, Dict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Any, ClassVar, DefaultDict, Iterable, Iterator, Optional, List, Dict, Deque,
+                    Mapping, Tuple, Union)
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+
+# Set to True to silence status messages from the model and Admin methods, e.g. during bulk imports
+QUIET = False
+
+
+def _notify(message: str) -> None:
+    """Print a status message unless QUIET is set"""
+    if not QUIET:
+        print(message)
+
+
+# Shared by every Admin for file I/O so saves and loads reuse the same worker threads
+# instead of starting new ones each time; they are joined at interpreter exit.
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+# bcrypt drops the GIL while hashing, so one thread per core lets hashes run in parallel
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def _model_default(obj: Any) -> Any:
+    """Serialize model instances met by the JSON encoder through their to_dict"""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_model_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_model_default).encode("utf-8")
+
+
+def _intern(value: Any) -> Any:
+    """Intern value if it is a string; None and other loaded values pass through unchanged"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _load_json(raw: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write data with a single unbuffered write to a temp file, then swap it into place"""
+    tmp = path + ".tmp"
+    view = memoryview(data)
+    try:
+        with open(tmp, "wb", buffering=0) as file:
+            # Raw writes may be short, so keep going until every byte is out
+            while view:
+                view = view[file.write(view):]
+            # Get the data onto disk before the rename can make it the real file
+            os.fsync(file.fileno())
+        # A crash mid-save leaves the previous file intact instead of a truncated one
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _parse_items(raw: str) -> Dict[str, int]:
+    """Decode order items JSON and check it is an {item: positive quantity} object"""
+    items = _load_json(raw)
+    if not isinstance(items, dict) or not all(
+            type(quantity) is int and quantity > 0 for quantity in items.values()):
+        raise ValueError("items must map item names to positive whole quantities")
+    return items
+
+
+def _parse_menus(raw: str) -> Dict[str, Dict[str, float]]:
+    """Decode menus JSON and check it is a {menu type: {item: price}} object"""
+    menus = _load_json(raw)
+    if not isinstance(menus, dict):
+        raise ValueError("menus must be a JSON object")
+    parsed: Dict[str, Dict[str, float]] = {}
+    for menu_type, menu in menus.items():
+        if not isinstance(menu, dict) or not all(
+                type(price) in (int, float) and price >= 0 for price in menu.values()):
+            raise ValueError(f"menu '{menu_type}' must map item names to prices")
+        parsed[menu_type] = {item: float(price) for item, price in menu.items()}
+    return parsed
+
+
+def _iter_json_file(path: str) -> Iterator[Any]:
+    """Yield the records of a JSON array file, streaming them with ijson when it is installed"""
+    if ijson is None:
+        # Pop records off the parsed list so each dict is freed once its model is built
+        records = _load_json(Path(path).read_bytes())
+        records.reverse()
+        while records:
+            yield records.pop()
+        return
+    # Build records one at a time instead of holding the whole parsed list alongside the models
+    with open(path, "rb") as file:
+        try:
+            yield from ijson.items(file, "item", use_float=True)
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
 
 
 class User:
     """User Registration and Authentication"""
-    def __init__(self, name: str, email: str, password: str, hashed: bool = False) -> None:
+    # Raise this as hardware gets faster; each step doubles the hashing time
+    _BCRYPT_COST: ClassVar[int] = 12
+    __slots__ = ('name', 'email', '_password', '_password_bytes', '_created_at', '_created_at_iso')
+
+    def __init__(self, name: str, email: str, password: str, hashed: bool = False,
+                 created_at: Optional[str] = None) -> None:
         self.name = name
         self.email = email
         if not hashed:
             self.password = self.hash_password(password)
         else:
             self.password = password
-        self.created_at = datetime.now()
-
+        # Keep the ISO string for serialization; the datetime is parsed lazily when needed
+        if created_at is None:
+            now = datetime.now()
+            self._created_at: Optional[datetime] = now
+            self._created_at_iso = now.isoformat()
+        else:
+            self._created_at = None
+            self._created_at_iso = created_at
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time, parsed from the stored ISO string on first access"""
+        if self._created_at is None:
+            self._created_at = datetime.fromisoformat(self._created_at_iso)
+        return self._created_at
+
+    @property
+    def password(self) -> str:
+        """The bcrypt hash as stored in users.json"""
+        return self._password
+
+    @password.setter
+    def password(self, value: str) -> None:
+        # Encode the hash once here rather than on every check_password call
+        self._password = value
+        self._password_bytes = value.encode()
 
-    @staticmethod
-    def hash_password(password: str) -> str:
+    @classmethod
+    def hash_password(cls, password: str) -> str:
         """Hash password using bcrypt"""
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(cls._BCRYPT_COST)
         return bcrypt.hashpw(password.encode(), salt).decode()
 
-    def check_password(self, password: str) -> bool:
-        """Verify password"""
-        return bcrypt.checkpw(password.encode(), self.password.encode())
+    @classmethod
+    def set_cost(cls, cost: int) -> None:
+        """Change the bcrypt work factor used for new hashes; existing hashes keep theirs"""
+        if not 4 <= cost <= 31:
+            raise ValueError("bcrypt cost must be between 4 and 31")
+        cls._BCRYPT_COST = cost
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """Hash password on the shared hash pool without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(_HASH_POOL, User.hash_password, password)
+
+    @staticmethod
+    def hash_passwords_bulk(passwords: List[str]) -> List[str]:
+        """Hash many passwords in parallel, keeping their order"""
+        return list(_HASH_POOL.map(User.hash_password, passwords))
 
-    def to_dict(self) -> Dict:
+    def check_password(self, password: Union[str, bytes]) -> bool:
+        """Verify password"""
+        # A bcrypt hash is always 60 bytes starting with "$2"; reject anything else up front
+        # rather than letting checkpw raise on a corrupt record
+        if len(self._password_bytes) != 60 or not self._password_bytes.startswith(b"$2"):
+            _notify(f"⚠️ Stored password for {self.email} is not a valid bcrypt hash.")
+            return False
+        if isinstance(password, str):
+            password = password.encode()
+        return bcrypt.checkpw(password, self._password_bytes)
+
+    def to_dict(self) -> Dict[str, Any]:
         """Convert user to dictionary for JSON serialization"""
         return {
             "name": self.name,
             "email": self.email,
             "password": self.password,  # This is the hashed password
-            "created_at": self.created_at.isoformat()
+            "created_at": self._created_at_iso
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'User':
+    def from_dict(cls, data: Dict[str, Any]) -> 'User':
         """Create user from dictionary without re-hashing the already hashed password"""
         # We pass hashed=True so the _init_ knows the password is already hashed
-        user = cls(data['name'], data['email'], data['password'], hashed=True)
-        user.created_at = datetime.fromisoformat(data['created_at'])
-        return user
+        return cls(data['name'], data['email'], data['password'], hashed=True,
+                   created_at=data['created_at'])
 
     @staticmethod
-    def login(email: str, password: str, users: List['User']) -> Optional['User']:
-        """Authenticate user login"""
+    def login(email: str, password: str,
+              users: Union[List['User'], Mapping[str, 'User']]) -> Optional['User']:
+        """Authenticate user login; pass an email -> User mapping for an O(1) lookup"""
         if not users:
             raise ValueError("No users available")
         if not email or not password:
             raise ValueError('Email and password are required')
 
+        if isinstance(users, Mapping):
+            user = users.get(email)
+            return user if user and user.check_password(password) else None
+
         for user in users:
             if user.email == email and user.check_password(password):
                 return user
@@ -58,18 +238,16 @@ class User:
 
 
     @staticmethod
-    def save_users(users: List['User'], filename: str = 'users.json') -> None:
+    def save_users(users: List['User'], filename: str = 'users.json') -> bool:
         """Save users to JSON file"""
-        with open(filename, 'w', encoding="utf-8") as f:
-            json.dump([user.to_dict() for user in users], f, indent=4)
+        _atomic_write(filename, _dump_json(users))
+        return True
 
     @staticmethod
     def load_users(filename: str = 'users.json') -> List['User']:
         """Load users from JSON file"""
         try:
-            with open(filename, 'r', encoding="utf-8") as f:
-                user_data = json.load(f)
-                return [User.from_dict(data) for data in user_data]
+            return [User.from_dict(data) for data in _iter_json_file(filename)]
         except FileNotFoundError:
             return []
         except json.JSONDecodeError:
@@ -79,13 +257,36 @@ class User:
 
 class Restaurant:
     """Registration for restaurants"""
+    __slots__ = ('name', 'menus', 'availability', '_flat_prices', '_info')
 
     def __init__(self, name: str, menus: Dict[str, Dict[str, float]], availability: bool = True) -> None:
         self.name = name
         self.menus = menus  # e.g., {"breakfast": {"Pancakes": 5.99, "Coffee": 2.99}, ...}
         self.availability = availability
-
-    def to_dict(self) -> Dict:
+        self._flat_prices: Optional[Dict[str, float]] = None
+        # (name, availability, text) behind info_text; menu changes clear it like _flat_prices
+        self._info: Optional[Tuple[str, bool, str]] = None
+
+    @property
+    def prices(self) -> Dict[str, float]:
+        """Flat item -> price lookup across all menus, built on first use"""
+        if self._flat_prices is None:
+            prices: Dict[str, float] = {}
+            # Update in reverse so an item listed in several menus keeps its first price
+            for menu in reversed(list(self.menus.values())):
+                if isinstance(menu, dict):
+                    prices.update(menu)
+            self._flat_prices = prices
+        return self._flat_prices
+
+    def price_items(self, items: Dict[str, int]) -> Tuple[Dict[str, int], float, List[str]]:
+        """Split ordered items into the priced ones, their total, and the names not on any menu"""
+        prices = self.prices
+        valid_items = {item: quantity for item, quantity in items.items() if item in prices}
+        total_price = sum(prices[item] * quantity for item, quantity in valid_items.items())
+        return valid_items, total_price, [item for item in items if item not in prices]
+
+    def to_dict(self) -> Dict[str, Any]:
         """Convert restaurant to dictionary for JSON serialization"""
         return {
             "name": self.name,
@@ -95,28 +296,28 @@ class Restaurant:
 
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Restaurant':
+    def from_dict(cls, data: Dict[str, Any]) -> 'Restaurant':
         """Create Restaurant instance from dictionary"""
-        menus = data.get('menus', {})
+        # Menu types like "breakfast" repeat across restaurants, so share one string per key
+        menus = {sys.intern(menu_type): menu for menu_type, menu in data.get('menus', {}).items()}
         # Using .get for availability in case it is missing in JSON (default True)
         return cls(data['name'], menus, data.get('availability', True))
 
     @staticmethod
-    def save_restaurants(restaurants: List['Restaurant'], file_name: str = 'restaurants.json') -> None:
+    def save_restaurants(restaurants: List['Restaurant'], file_name: str = 'restaurants.json') -> bool:
         """Save restaurants to a JSON file"""
         try:
-            with open(file_name, "w", encoding="utf-8") as file:
-                json.dump([restaurant.to_dict() for restaurant in restaurants], file, indent=4)
+            _atomic_write(file_name, _dump_json(restaurants))
+            return True
         except Exception as e:
             print(f"Error saving data: {e}")
+            return False
 
     @staticmethod
     def load_restaurants(file_name: str = 'restaurants.json') -> List['Restaurant']:
         """Load restaurants from a JSON file"""
         try:
-            with open(file_name, "r", encoding="utf-8") as file:
-                restaurant_data = json.load(file)
-                return [Restaurant.from_dict(data) for data in restaurant_data]
+            return [Restaurant.from_dict(data) for data in _iter_json_file(file_name)]
         except FileNotFoundError:
             return []
         except json.JSONDecodeError:
@@ -126,47 +327,77 @@ class Restaurant:
     def update_menu(self, menu_type: str, new_menu: Dict[str, float]) -> str:
         """Update or add a specific menu type"""
         self.menus[menu_type] = new_menu
+        self._flat_prices = None
+        self._info = None
         return f"Menu '{menu_type}' updated for '{self.name}'."
 
     def remove_menu(self, menu_type: str) -> str:
         """Remove a specific menu type"""
         if menu_type in self.menus:
             del self.menus[menu_type]
+            self._flat_prices = None
+            self._info = None
             return f"Menu '{menu_type}' removed from '{self.name}'."
         return f"Menu '{menu_type}' not found in '{self.name}'."
 
     def display_info(self) -> None:
         """Display restaurant information"""
-        print("=" * 40)
-        print(f"🍽 Restaurant: {self.name}")
-        print(f"📌 Status: {'🟢 Open' if self.availability else '🔴 Closed'}")
-        print("-" * 40)
-        print("📜 Menus:")
+        sys.stdout.write(self.info_text())
+
+    def info_text(self) -> str:
+        """Restaurant information as printed by display_info, cached until the restaurant changes"""
+        info = self._info
+        if info is not None and info[0] == self.name and info[1] == self.availability:
+            return info[2]
+        lines = [
+            "=" * 40,
+            f"🍽 Restaurant: {self.name}",
+            f"📌 Status: {'🟢 Open' if self.availability else '🔴 Closed'}",
+            "-" * 40,
+            "📜 Menus:",
+        ]
         # Loop through each menu type and its items
         for menu_type, items in self.menus.items():
-            print(f"  🍱 {menu_type.capitalize()}:")
+            lines.append(f"  🍱 {menu_type.capitalize()}:")
             if isinstance(items, dict):
-                for item, price in items.items():
-                    print(f"    - {item}: ${price:.2f}")
+                lines.extend(f"    - {item}: ${price:.2f}" for item, price in items.items())
             else:
-                print(f"    - Invalid menu format for {menu_type}")
-        print("=" * 40)
+                lines.append(f"    - Invalid menu format for {menu_type}")
+        lines.append("=" * 40)
+        text = "\n".join(lines) + "\n"
+        self._info = (self.name, self.availability, text)
+        return text
 
 
 class Order:
     """Take customer order"""
+    __slots__ = ('user_email', 'restaurant_name', 'items', 'status', 'driver_email',
+                 '_order_at', '_order_at_iso')
 
     def __init__(self, user_email: str, restaurant_name: str, items: Dict[str, int], 
-                 status: str = 'pending', driver_email: Optional[str] = None) -> None:
+                 status: str = 'pending', driver_email: Optional[str] = None,
+                 order_at: Optional[str] = None) -> None:
         self.user_email = user_email
         self.restaurant_name = restaurant_name
         self.items = items  # items is a dictionary like {"Pancakes": 3}
         self.status = status
         self.driver_email = driver_email
-        self.orderAt = datetime.now()
+        if order_at is None:
+            now = datetime.now()
+            self._order_at: Optional[datetime] = now
+            self._order_at_iso = now.isoformat()
+        else:
+            self._order_at = None
+            self._order_at_iso = order_at
 
+    @property
+    def orderAt(self) -> datetime:
+        """Order time, parsed from the stored ISO string on first access"""
+        if self._order_at is None:
+            self._order_at = datetime.fromisoformat(self._order_at_iso)
+        return self._order_at
 
-    def to_dict(self) -> Dict:
+    def to_dict(self) -> Dict[str, Any]:
         """Convert order to dictionary for JSON serialization"""
         return {
             "user_email": self.user_email,
@@ -174,38 +405,38 @@ class Order:
             "items": self.items,
             "status": self.status,
             "driver_email": self.driver_email,
-            "orderAt": self.orderAt.isoformat()
+            "orderAt": self._order_at_iso
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Order':
+    def from_dict(cls, data: Dict[str, Any]) -> 'Order':
         """Load order from dictionary"""
-        order = cls(
-            data['user_email'],
-            data['restaurant_name'],
+        # Intern the status so comparisons against the "pending" literal hit the identity fast path;
+        # emails and restaurant names repeat across orders, so they share one string each too
+        return cls(
+            _intern(data['user_email']),
+            _intern(data['restaurant_name']),
             data['items'],
-            data.get('status', 'pending'),
-            data.get('driver_email')
+            _intern(data.get('status', 'pending')),
+            _intern(data.get('driver_email')),
+            data['orderAt']
         )
-        order.orderAt = datetime.fromisoformat(data['orderAt'])
-        return order
 
     @staticmethod
-    def save_order(orders: List['Order'], file_name: str = 'orders.json') -> None:
+    def save_order(orders: List['Order'], file_name: str = 'orders.json') -> bool:
         """Save orders to a JSON file"""
         try:
-            with open(file_name, "w", encoding="utf-8") as file:
-                json.dump([order.to_dict() for order in orders], file, indent=4)
+            _atomic_write(file_name, _dump_json(orders))
+            return True
         except Exception as e:
             print(f"Error saving orders: {e}")
+            return False
 
     @staticmethod
     def load_order(file_name: str = 'orders.json') -> List['Order']:
         """Load orders from a JSON file"""
         try:
-            with open(file_name, "r", encoding="utf-8") as file:
-                order_data = json.load(file)
-                return [Order.from_dict(data) for data in order_data]
+            return [Order.from_dict(data) for data in _iter_json_file(file_name)]
         except FileNotFoundError:
             return []
         except json.JSONDecodeError:
@@ -219,35 +450,36 @@ class Order:
 
     def display_receipt(self, user: User, restaurant: Restaurant) -> None:
         """Display order receipt"""
-        print("\n--- RECEIPT ---")
-        print(f"👤 Customer: {user.name}")
-        print(f"🏪 Restaurant: {restaurant.name}")
-        print("🍽 Ordered Items:")
-
-        total_price = 0
+        # Price every line first so the total is one sum() instead of a running += in the print loop
+        prices = restaurant.prices
+        lines = []
         for item, quantity in self.items.items():
-            item_price = None
-            # Search through each menu in the restaurant for the item
-            for menu in restaurant.menus.values():
-                if item in menu:
-                    item_price = menu[item]
-                    break
-
+            item_price = prices.get(item)
+            lines.append((item, quantity, item_price, 0 if item_price is None else item_price * quantity))
+        total_price = sum(line[3] for line in lines)
+
+        # Collect the receipt and emit it with a single write
+        output = [
+            "\n--- RECEIPT ---",
+            f"👤 Customer: {user.name}",
+            f"🏪 Restaurant: {restaurant.name}",
+            "🍽 Ordered Items:",
+        ]
+        for item, quantity, item_price, price in lines:
             if item_price is not None:
-                price = item_price * quantity
-                total_price += price
-                print(f"  - {item}: {quantity} x ${item_price:.2f} = ${price:.2f}")
+                output.append(f"  - {item}: {quantity} x ${item_price:.2f} = ${price:.2f}")
             else:
-                print(f"  - {item}: Not found in {restaurant.name}")
-
-        print(f"💰 Total: ${total_price:.2f}")
-        print(f"📌 Status: {self.status.capitalize()}")
-        print(f"📅 Ordered at: {self.orderAt.strftime('%Y-%m-%d %H:%M:%S')}")
-        print("----------------\n")
+                output.append(f"  - {item}: Not found in {restaurant.name}")
+        output.append(f"💰 Total: ${total_price:.2f}")
+        output.append(f"📌 Status: {self.status.capitalize()}")
+        output.append(f"📅 Ordered at: {self.orderAt.strftime('%Y-%m-%d %H:%M:%S')}")
+        output.append("----------------\n")
+        sys.stdout.write("\n".join(output) + "\n")
 
 
 class Driver:
     """Class for drivers"""
+    __slots__ = ('name', 'email', 'orders', 'available')
 
     def __init__(self, name: str, email: str) -> None:
         self.name = name
@@ -256,7 +488,7 @@ class Driver:
         self.available = True          # Indicates if the driver is available for a new order
 
 
-    def to_dict(self) -> Dict:
+    def to_dict(self) -> Dict[str, Any]:
         """Convert driver to dictionary for JSON serialization"""
         return {
             "name": self.name,
@@ -266,7 +498,7 @@ class Driver:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Driver':
+    def from_dict(cls, data: Dict[str, Any]) -> 'Driver':
         """Load driver from dictionary"""
         driver = cls(data['name'], data['email'])
         driver.orders = [Order.from_dict(order_data) for order_data in data.get('orders', [])]
@@ -274,58 +506,107 @@ class Driver:
         return driver
 
     @staticmethod
-    def save_driver(drivers: List['Driver'], file_name: str = 'drivers.json') -> None:
+    def save_driver(drivers: List['Driver'], file_name: str = 'drivers.json') -> bool:
         """Save driver list to a JSON file"""
         try:
-            with open(file_name, "w", encoding="utf-8") as file:
-                json.dump([driver.to_dict() for driver in drivers], file, indent=4)
+            _atomic_write(file_name, _dump_json(drivers))
+            return True
         except Exception as e:
             print(f"Error saving drivers: {e}")
+            return False
 
     @staticmethod
     def load_driver(file_name: str = 'drivers.json') -> List['Driver']:
         """Load drivers from a JSON file"""
         try:
-            with open(file_name, "r", encoding="utf-8") as file:
-                driver_data = json.load(file)
-                return [Driver.from_dict(data) for data in driver_data]
+            return [Driver.from_dict(data) for data in _iter_json_file(file_name)]
         except FileNotFoundError:
             return []
         except json.JSONDecodeError:
             print("Error: Corrupted JSON file.")
             return []
 
-    def assign_order(self, order: Order) -> None:
-        """Assign an order to the driver"""
+    def assign_order(self, order: Order) -> bool:
+        """Assign an order to the driver, returning whether the driver took it"""
         if not self.available:
-            print(f"🚫 Driver {self.name} is not available to take new orders.")
-            return
+            _notify(f"🚫 Driver {self.name} is not available to take new orders.")
+            return False
 
         self.available = False
         self.orders.append(order)
         order.status = "assigned"
         order.driver_email = self.email
-        print(f"✅ Order for {order.restaurant_name} assigned to driver {self.name}.")
+        _notify(f"✅ Order for {order.restaurant_name} assigned to driver {self.name}.")
+        return True
 
-    def complete_order(self) -> None:
-        """Complete the last assigned order"""
+    def complete_order(self) -> Optional[Order]:
+        """Complete the last assigned order and return it; use Admin.complete_order to requeue the driver"""
         if not self.orders:
-            print(f"🚫 Driver {self.name} has no active orders to complete.")
-            return
+            _notify(f"🚫 Driver {self.name} has no active orders to complete.")
+            return None
 
         order = self.orders.pop()
         order.status = "delivered"
         self.available = True
-        print(f"✅ Order from '{order.restaurant_name}' delivered by driver '{self.name}'.")
+        _notify(f"✅ Order from '{order.restaurant_name}' delivered by driver '{self.name}'.")
+        return order
 
 
 class Admin:
     """Admin panel for managing users, restaurants, orders, and drivers"""
     def __init__(self) -> None:
-        self.restaurants: List[Restaurant] = []
         self.users: List[User] = []
         self.orders: List[Order] = []
         self.drivers: List[Driver] = []
+        # Hash indexes kept in sync with the lists above for O(1) lookups
+        self.users_by_email: Dict[str, User] = {}
+        self.drivers_by_email: Dict[str, Driver] = {}
+        self.orders_by_user: DefaultDict[str, List[Order]] = defaultdict(list)
+        # Restaurants only live in this index; see the restaurants property
+        self.restaurants_by_name: Dict[str, Restaurant] = {}
+        # FIFO queues of work to hand out in assign_order_to_driver
+        self.pending_orders: Deque[Order] = deque()
+        self.available_drivers: Deque[Driver] = deque()
+        # (file, digest of its contents) for each collection as last saved
+        self._saved: Dict[str, Tuple[str, bytes]] = {}
+
+    def _save_if_changed(self, name: str, items: List[Any], path: str) -> Optional[bytes]:
+        """Write a collection unless the file already holds exactly this data; return its digest"""
+        payload = _dump_json(items)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._saved.get(name) == (path, digest) and os.path.exists(path):
+            return digest
+        try:
+            _atomic_write(path, payload)
+        except OSError as e:
+            print(f"Error saving {name}: {e}")
+            return None
+        return digest
+
+    @property
+    def restaurants(self) -> List[Restaurant]:
+        """Restaurants in insertion order, backed by restaurants_by_name"""
+        return list(self.restaurants_by_name.values())
+
+    @restaurants.setter
+    def restaurants(self, restaurants: List[Restaurant]) -> None:
+        self.restaurants_by_name = {}
+        for restaurant in restaurants:
+            self.restaurants_by_name.setdefault(restaurant.name, restaurant)
+
+    def rebuild_indexes(self) -> None:
+        """Rebuild the lookup indexes and work queues from the loaded lists"""
+        self.users_by_email = {}
+        for user in self.users:
+            self.users_by_email.setdefault(user.email, user)
+        self.drivers_by_email = {}
+        for driver in self.drivers:
+            self.drivers_by_email.setdefault(driver.email, driver)
+        self.orders_by_user = defaultdict(list)
+        for order in self.orders:
+            self.orders_by_user[order.user_email].append(order)
+        self.pending_orders = deque(order for order in self.orders if order.status == "pending")
+        self.available_drivers = deque(driver for driver in self.drivers if driver.available)
 
     def save_data(
         self, 
@@ -333,13 +614,28 @@ class Admin:
         restaurant_file: str = 'restaurants.json', 
         order_file: str = 'orders.json', 
         driver_file: str = 'drivers.json'
-    ):
-        """Save all data to JSON files"""
-        User.save_users(self.users, user_file)
-        Restaurant.save_restaurants(self.restaurants, restaurant_file)
-        Order.save_order(self.orders, order_file)
-        Driver.save_driver(self.drivers, driver_file)
-        print("✅ Data saved successfully!")
+    ) -> None:
+        """Save all data to JSON files, skipping files that already hold the same data"""
+        jobs: List[Tuple[str, List[Any], str]] = [
+            ("users", self.users, user_file),
+            ("restaurants", self.restaurants, restaurant_file),
+            ("orders", self.orders, order_file),
+            ("drivers", self.drivers, driver_file),
+        ]
+        # Comparing serialized contents catches every change, including ones made directly on
+        # the models. Every collection is still serialized; only the disk write is skipped.
+        # The four files are independent, so overlap their work
+        futures = [
+            (name, path, _IO_POOL.submit(self._save_if_changed, name, items, path))
+            for name, items, path in jobs
+        ]
+        for name, path, future in futures:
+            digest = future.result()
+            if digest is None:
+                self._saved.pop(name, None)
+            else:
+                self._saved[name] = (path, digest)
+        _notify("✅ Data saved successfully!")
 
     def load_data(
         self, 
@@ -347,66 +643,125 @@ class Admin:
         restaurant_file: str = 'restaurants.json', 
         order_file: str = 'orders.json', 
         driver_file: str = 'drivers.json'
-    ):
+    ) -> None:
         """Load all data from JSON files"""
-        self.users = User.load_users(user_file)
-        self.restaurants = Restaurant.load_restaurants(restaurant_file)
-        self.orders = Order.load_order(order_file)
-        self.drivers = Driver.load_driver(driver_file)
-        print("✅ Data loaded successfully!")
-
-    def add_user(self, name: str, email: str, password: str) -> None:
-        """Add a new user"""
-        if any(user.email == email for user in self.users):
-            print(f"🚫 User with email {email} already exists.")
-            return
+        users = _IO_POOL.submit(User.load_users, user_file)
+        restaurants = _IO_POOL.submit(Restaurant.load_restaurants, restaurant_file)
+        orders = _IO_POOL.submit(Order.load_order, order_file)
+        drivers = _IO_POOL.submit(Driver.load_driver, driver_file)
+        self.users = users.result()
+        self.restaurants = restaurants.result()
+        self.orders = orders.result()
+        self.drivers = drivers.result()
+        self.rebuild_indexes()
+        # Hashing the files here would read each one twice, so the first save writes them all
+        self._saved = {}
+        _notify("✅ Data loaded successfully!")
+
+    def login(self, email: str, password: str) -> Optional[User]:
+        """Authenticate user login through the email index"""
+        return User.login(email, password, self.users_by_email)
+
+    def add_user(self, name: str, email: str, password: str) -> Optional[User]:
+        """Add a new user and return it, or None if the email is taken"""
+        if email in self.users_by_email:
+            _notify(f"🚫 User with email {email} already exists.")
+            return None
         new_user = User(name, email, password)
         self.users.append(new_user)
-        print(f"✅ User '{name}' added successfully!")
-
-    def add_restaurant(self, name: str, menus: Dict[str, Dict[str, float]], availability: bool = True):
-        """Add a new restaurant"""
-        if any(r.name == name for r in self.restaurants):
-            print(f"🚫 Restaurant '{name}' already exists.")
-            return
+        self.users_by_email[email] = new_user
+        _notify(f"✅ User '{name}' added successfully!")
+        return new_user
+
+    async def add_user_async(self, name: str, email: str, password: str) -> Optional[User]:
+        """Add a new user like add_user, awaiting the password hash instead of blocking on it"""
+        if email in self.users_by_email:
+            _notify(f"🚫 User with email {email} already exists.")
+            return None
+        hashed = await User.hash_password_async(password)
+        # Another signup may have claimed the email while the hash was running
+        if email in self.users_by_email:
+            _notify(f"🚫 User with email {email} already exists.")
+            return None
+        new_user = User(name, email, hashed, hashed=True)
+        self.users.append(new_user)
+        self.users_by_email[email] = new_user
+        _notify(f"✅ User '{name}' added successfully!")
+        return new_user
+
+    def add_users_bulk(self, users: Iterable[Tuple[str, str, str]]) -> List[User]:
+        """Add many (name, email, password) users at once, hashing their passwords in parallel"""
+        new_users: List[Tuple[str, str, str]] = []
+        seen = set(self.users_by_email)
+        for name, email, password in users:
+            if email in seen:
+                _notify(f"🚫 User with email {email} already exists.")
+                continue
+            seen.add(email)
+            new_users.append((name, email, password))
+
+        hashes = User.hash_passwords_bulk([password for _, _, password in new_users])
+        added = []
+        for (name, email, _), hashed in zip(new_users, hashes):
+            new_user = User(name, email, hashed, hashed=True)
+            self.users.append(new_user)
+            self.users_by_email[email] = new_user
+            added.append(new_user)
+        _notify(f"✅ {len(added)} users added successfully!")
+        return added
+
+    def add_restaurant(self, name: str, menus: Dict[str, Dict[str, float]], availability: bool = True) -> Optional[Restaurant]:
+        """Add a new restaurant and return it, or None if the name is taken"""
+        if name in self.restaurants_by_name:
+            _notify(f"🚫 Restaurant '{name}' already exists.")
+            return None
         new_restaurant = Restaurant(name, menus, availability)
-        self.restaurants.append(new_restaurant)
-        print(f"✅ Restaurant '{name}' added successfully!")
-
-    def add_driver(self, name: str, email: str):
-        """Add a new driver"""
-        if any(d.email == email for d in self.drivers):
-            print(f"🚫 Driver with email {email} already exists.")
-            return
+        self.restaurants_by_name[name] = new_restaurant
+        _notify(f"✅ Restaurant '{name}' added successfully!")
+        return new_restaurant
+
+    def add_driver(self, name: str, email: str) -> Optional[Driver]:
+        """Add a new driver and return it, or None if the email is taken"""
+        if email in self.drivers_by_email:
+            _notify(f"🚫 Driver with email {email} already exists.")
+            return None
         new_driver = Driver(name, email)
         self.drivers.append(new_driver)
-        print(f"✅ Driver '{name}' added successfully!")
+        self.drivers_by_email[email] = new_driver
+        self.available_drivers.append(new_driver)
+        _notify(f"✅ Driver '{name}' added successfully!")
+        return new_driver
 
-    def update_restaurant_menu(self, restaurant_name: str, menu_type: str, new_menu: Dict[str, float]) -> None:
+    def update_restaurant_menu(self, restaurant_name: str, menu_type: str, new_menu: Dict[str, float]) -> bool:
         """
         Update a specific menu type for a restaurant.
         This method now requires the menu type (like 'breakfast') as well.
         """
-        restaurant = next((r for r in self.restaurants if r.name == restaurant_name), None)
+        restaurant = self.restaurants_by_name.get(restaurant_name)
         if not restaurant:
-            print(f"🚫 Restaurant '{restaurant_name}' not found!")
-            return
+            _notify(f"🚫 Restaurant '{restaurant_name}' not found!")
+            return False
         result = restaurant.update_menu(menu_type, new_menu)
-        print(f"✅ {result}")
+        _notify(f"✅ {result}")
+        return True
 
-    def remove_restaurant(self, restaurant_name: str) -> None:
+    def remove_restaurant(self, restaurant_name: str) -> bool:
         """Remove a restaurant"""
-        self.restaurants = [r for r in self.restaurants if r.name != restaurant_name]
-        print(f"✅ Restaurant '{restaurant_name}' removed.")
+        if self.restaurants_by_name.pop(restaurant_name, None) is None:
+            _notify(f"🚫 Restaurant '{restaurant_name}' not found!")
+            return False
+        _notify(f"✅ Restaurant '{restaurant_name}' removed.")
+        return True
 
-    def update_availability(self, restaurant_name: str, availability: bool) -> None:
+    def update_availability(self, restaurant_name: str, availability: bool) -> bool:
         """Update restaurant availability"""
-        restaurant = next((r for r in self.restaurants if r.name == restaurant_name), None)
+        restaurant = self.restaurants_by_name.get(restaurant_name)
         if not restaurant:
-            print(f"🚫 Restaurant '{restaurant_name}' not found!")
-            return
+            _notify(f"🚫 Restaurant '{restaurant_name}' not found!")
+            return False
         restaurant.availability = availability
-        print(f"✅ Availability updated for '{restaurant_name}'.")
+        _notify(f"✅ Availability updated for '{restaurant_name}'.")
+        return True
 
     def list_users(self) -> None:
         """List all users"""
@@ -417,85 +772,209 @@ class Admin:
             print(f"👤 User: {user.name}, Email: {user.email}")
 
     def list_restaurants(self) -> None:
-        """List all restaurants"""
-        if not self.restaurants:
+        """List all restaurants, reusing each restaurant's cached text when it has not changed"""
+        if not self.restaurants_by_name:
             print("🚫 No restaurants available!")
             return
-        for restaurant in self.restaurants:
-            restaurant.display_info()
+        sys.stdout.write("".join(restaurant.info_text() for restaurant in self.restaurants_by_name.values()))
 
     def list_drivers(self) -> None:
         """List all drivers"""
         if not self.drivers:
             print("🚫 No drivers available!")
             return
+        lines = []
         for driver in self.drivers:
             status = "Available" if driver.available else "Delivering"
-            print(f"👤 Driver: {driver.name}, Email: {driver.email}, Status: {status}")
+            lines.append(f"👤 Driver: {driver.name}, Email: {driver.email}, Status: {status}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    def place_order(self, user_email: str, restaurant_name: str, items: Dict[str, int]) -> None:
-        """Place an order with item validation"""
-        restaurant = next((r for r in self.restaurants if r.name == restaurant_name and r.availability), None)
-        if not restaurant:
-            print(f"🚫 Restaurant '{restaurant_name}' is not available!")
-            return
+    def place_order(self, user_email: str, restaurant_name: str, items: Dict[str, int]) -> Optional[Order]:
+        """Place an order with item validation and return it, or None if nothing could be ordered"""
+        restaurant = self.restaurants_by_name.get(restaurant_name)
+        if not restaurant or not restaurant.availability:
+            _notify(f"🚫 Restaurant '{restaurant_name}' is not available!")
+            return None
 
-        total_price = 0
-        valid_items = {}
-        for item, quantity in items.items():
-            item_price = None
-            for menu in restaurant.menus.values():
-                if item in menu:
-                    item_price = menu[item]
-                    break
-            if item_price is None:
-                print(f"🚫 Item '{item}' not found in {restaurant.name}'s menu")
-                continue
-            valid_items[item] = quantity
-            total_price += item_price * quantity
+        # Price the order first, then report the missing items in one message
+        valid_items, total_price, missing = restaurant.price_items(items)
+        if missing:
+            _notify("\n".join(f"🚫 Item '{item}' not found in {restaurant.name}'s menu" for item in missing))
 
         if not valid_items:
-            print("🚫 No valid items in order!")
-            return
+            _notify("🚫 No valid items in order!")
+            return None
 
         order = Order(user_email, restaurant_name, valid_items)
         self.orders.append(order)
-        print(f"✅ Order placed successfully! Total: ${total_price:.2f}")
-
-    def assign_order_to_driver(self) -> None:
-        """Assign pending orders to available drivers"""
-        pending_orders = [order for order in self.orders if order.status == "pending"]
-        available_drivers = [driver for driver in self.drivers if driver.available]
-
-        if not pending_orders:
-            print("🚫 No pending orders!")
-            return
-
-        if not available_drivers:
-            print("🚫 No available drivers!")
-            return
+        self.orders_by_user[user_email].append(order)
+        self.pending_orders.append(order)
+        _notify(f"✅ Order placed successfully! Total: ${total_price:.2f}")
+        return order
 
-        for i, order in enumerate(pending_orders):
-            driver = available_drivers[i % len(available_drivers)]
+    def assign_order_to_driver(self) -> int:
+        """Assign pending orders to available drivers and return how many were assigned"""
+        if not self.pending_orders:
+            _notify("🚫 No pending orders!")
+            return 0
+
+        if not self.available_drivers:
+            _notify("🚫 No available drivers!")
+            return 0
+
+        assigned = 0
+        # Each driver takes one order at a time, so hand out orders until either queue runs dry.
+        # Entries can go stale when Driver methods are called directly, so drop any order that is
+        # no longer pending and any driver that is busy (which also covers a driver queued twice).
+        # Drivers only rejoin the queue through Admin.complete_order; the fleet is never rescanned.
+        while self.pending_orders and self.available_drivers:
+            if self.pending_orders[0].status != "pending":
+                self.pending_orders.popleft()
+                continue
+            driver = self.available_drivers.popleft()
+            if not driver.available:
+                continue
+            order = self.pending_orders.popleft()
             driver.assign_order(order)
-            print(f"✅ Order from '{order.restaurant_name}' assigned to driver '{driver.name}'.")
+            assigned += 1
+            _notify(f"✅ Order from '{order.restaurant_name}' assigned to driver '{driver.name}'.")
+        return assigned
 
-    def complete_order(self, driver_email: str) -> None:
-        """Complete the last order assigned to a driver"""
-        driver = next((d for d in self.drivers if d.email == driver_email), None)
+    def complete_order(self, driver_email: str) -> Optional[Order]:
+        """Complete the last order assigned to a driver and return it"""
+        driver = self.drivers_by_email.get(driver_email)
         if not driver:
-            print(f"🚫 Driver with email {driver_email} not found!")
-            return
+            _notify(f"🚫 Driver with email {driver_email} not found!")
+            return None
 
         if not driver.orders:
-            print(f"🚫 Driver '{driver.name}' has no active orders!")
-            return
+            _notify(f"🚫 Driver '{driver.name}' has no active orders!")
+            return None
 
-        driver.complete_order()
-        print(f"✅ Order completed by driver '{driver.name}'.")
+        order = driver.complete_order()
+        if driver.available:
+            self.available_drivers.append(driver)
+        _notify(f"✅ Order completed by driver '{driver.name}'.")
+        return order
 
 
-def main():
+def _register_user(admin: Admin) -> None:
+    """Prompt for and register a new user"""
+    name = input("Enter your name: ")
+    email = input("Enter email: ")
+    password = input("Enter password: ")
+    admin.add_user(name, email, password)
+
+
+def _place_order(admin: Admin, user: User) -> None:
+    """Prompt for and place an order for the logged-in user"""
+    restaurant_name = input("Enter restaurant name: ")
+    items_input = input("Enter items as JSON (e.g: {\"item\": quantity}): ")
+    try:
+        items = _parse_items(items_input)
+    except ValueError:
+        print("Invalid JSON format. Please try again.")
+        return
+    admin.place_order(user.email, restaurant_name, items)
+
+
+def _view_orders(admin: Admin, user: User) -> None:
+    """Show receipts for the logged-in user's orders"""
+    # List orders that belong to the logged-in user.
+    user_orders = admin.orders_by_user.get(user.email)
+    if not user_orders:
+        print("No orders found")
+        return
+    for order in user_orders:
+        restaurant = admin.restaurants_by_name.get(order.restaurant_name)
+        if restaurant:
+            # Pass the whole user object instead of the email.
+            order.display_receipt(user, restaurant)
+        else:
+            print(f"Restaurant '{order.restaurant_name}' not found for the order.")
+
+
+# User menu choices other than "3" (logout), looked up instead of walking an if/elif chain
+USER_MENU_ACTIONS = {
+    "1": _place_order,
+    "2": _view_orders,
+}
+
+
+def _user_login(admin: Admin) -> None:
+    """Log a user in and run the user menu until they log out"""
+    email = input("Enter email: ")
+    password = input("Enter password: ")
+    logged_in_user = admin.login(email, password)
+    if not logged_in_user:
+        return
+    print(f"Welcome back, {logged_in_user.name}")
+
+    while True:
+        print("\nUser menu:")
+        print("1. Place order")
+        print("2. View orders")
+        print("3. Logout")
+
+        user_choice = input("Select an option (1-3): ")
+
+        if user_choice == "3":
+            print("Logging out...")
+            break
+        action = USER_MENU_ACTIONS.get(user_choice)
+        if action:
+            action(admin, logged_in_user)
+        else:
+            print("Invalid option. Try again later.")
+
+
+def _list_users(admin: Admin) -> None:
+    """List all users (admin only)"""
+    print("Listing all users:")
+    admin.list_users()
+
+
+def _add_restaurant(admin: Admin) -> None:
+    """Prompt for and add a restaurant (admin only)"""
+    name = input("Enter restaurant name: ")
+    menus_input = input("Enter menus as JSON (e.g: {\"breakfast\": {\"Pancakes\": 5.99, \"Coffee\": 2.99}}): ")
+    try:
+        menus = _parse_menus(menus_input)
+    except ValueError:
+        print("Invalid menu format. Please try again.")
+        return
+    admin.add_restaurant(name, menus)
+
+
+def _add_driver(admin: Admin) -> None:
+    """Prompt for and add a driver (admin only)"""
+    name = input("Enter driver name: ")
+    email = input("Enter driver email: ")
+    admin.add_driver(name, email)
+
+
+def _complete_order(admin: Admin) -> None:
+    """Prompt for a driver and complete their order (driver only)"""
+    driver_email = input("Enter driver email: ")
+    admin.complete_order(driver_email)
+
+
+# Main menu choices other than "12" (exit), looked up instead of walking an if/elif chain
+MAIN_MENU_ACTIONS = {
+    "1": _register_user,
+    "2": _user_login,
+    "3": _list_users,
+    "4": _add_restaurant,
+    "5": Admin.list_restaurants,
+    "7": Admin.assign_order_to_driver,
+    "8": _complete_order,
+    "9": _add_driver,
+    "10": Admin.list_drivers,
+    "11": Admin.save_data,
+}
+
+
+def main() -> None:
     """_main system_
     """
     admin = Admin()
@@ -524,99 +1003,14 @@ def main():
 
         choice = input("Select an option (1-12): ")
 
-        # User Registration
-        if choice == "1":
-            name = input("Enter your name: ")
-            email = input("Enter email: ")
-            password = input("Enter password: ")
-            admin.add_user(name, email, password)
-
-        # User Login
-        elif choice == "2":
-            email = input("Enter email: ")
-            password = input("Enter password: ")
-            logged_in_user = User.login(email, password, admin.users)
-            if logged_in_user:
-                print(f"Welcome back, {logged_in_user.name}")
-
-                while True:
-                    print("\nUser menu:")
-                    print("1. Place order")
-                    print("2. View orders")
-                    print("3. Logout")
-
-                    user_choice = input("Select an option (1-3): ")
-
-                    if user_choice == "1":
-                        restaurant_name = input("Enter restaurant name: ")
-                        items_input = input("Enter items as JSON (e.g: {\"item\": quantity}): ")
-                        try:
-                            items = json.loads(items_input)
-                            admin.place_order(logged_in_user.email, restaurant_name, items)
-                        except json.JSONDecodeError:
-                            print("Invalid JSON format. Please try again.")
-
-                    elif user_choice == "2":
-                        # List orders that belong to the logged-in user.
-                        user_orders = [order for order in admin.orders if order.user_email == logged_in_user.email]
-                        if not user_orders:
-                            print("No orders found")
-                        else:
-                            for order in user_orders:
-                                restaurant = next((r for r in admin.restaurants if r.name == order.restaurant_name), None)
-                                if restaurant:
-                                    # Pass the whole user object instead of the email.
-                                    order.display_receipt(logged_in_user, restaurant)
-                                else:
-                                    print(f"Restaurant '{order.restaurant_name}' not found for the order.")
-                    elif user_choice == "3":
-                        print("Logging out...")
-                        break
-                    else:
-                        print("Invalid option. Try again later.")
-
-        # Admin Actions
-        elif choice == "3":
-            print("Listing all users:")
-            admin.list_users()
-
-        elif choice == "4":
-            name = input("Enter restaurant name: ")
-            menus_input = input("Enter menus as JSON (e.g: {\"breakfast\": {\"Pancakes\": 5.99, \"Coffee\": 2.99}}): ")
-            try:
-                menus = json.loads(menus_input)
-                admin.add_restaurant(name, menus)
-            except json.JSONDecodeError:
-                print("Invalid menu format. Please try again.")
-
-        elif choice == "5":
-            admin.list_restaurants()
-
-        elif choice == "7":
-            admin.assign_order_to_driver()
-
-        elif choice == "9":
-            name = input("Enter driver name: ")
-            email = input("Enter driver email: ")
-            admin.add_driver(name, email)
-
-        elif choice == "10":
-            admin.list_drivers()
-
-        # Driver-only Actions
-        elif choice == "8":
-            driver_email = input("Enter driver email: ")
-            admin.complete_order(driver_email)
-
-        # Save Data
-        elif choice == "11":
-            admin.save_data()
-
         # Exit Program
-        elif choice == "12":
+        if choice == "12":
             print("Exiting the system...")
             break
 
+        action = MAIN_MENU_ACTIONS.get(choice)
+        if action:
+            action(admin)
         else:
             print("Invalid choice. Please select a valid option.")
 
@@ -1,11 +1,49 @@
+import asyncio
+import contextlib
+import io
+import json
+import os
+import tempfile
 import unittest
 from datetime import datetime
-from app import Driver
-from app import User, Restaurant, Order, Driver  
+from functools import cached_property
+from unittest.mock import patch
+import app
+from app import User, Restaurant, Order, Driver, Admin
+
+# True when app was built with mypyc, whose native classes check attribute types
+COMPILED = not app.__file__.endswith(".py")
+
+# A fixed timestamp keeps loaded records deterministic and comparable
+_FIXED_ISO = datetime(2024, 1, 1, 12, 0, 0).isoformat()
+
+# Fields each fixture's to_dict must produce, checked with one dict comparison per test
+EXPECTED_USER = {"name": "John Doe", "email": "john@example.com"}
+EXPECTED_RESTAURANT = {"name": "Pizza Place", "menus": {"lunch": {"Margherita": 8.99, "Pepperoni": 9.99}},
+                       "availability": True}
+EXPECTED_ORDER = {"user_email": "john@example.com", "restaurant_name": "Pizza Place",
+                  "items": {"Margherita": 2, "Pepperoni": 1}, "status": "pending", "driver_email": None}
+EXPECTED_DRIVER = {"name": "John Doe", "email": "johndoe@gmail.com", "orders": [], "available": True}
+
+# Hashing with bcrypt dominates setup, so hash the shared password once per run and build
+# users from it with hashed=True
+_BASE_HASH = None
+
+
+def setUpModule():
+    global _BASE_HASH
+    _BASE_HASH = User.hash_password("securepassword")
+
+
+def _make_user():
+    return User(name="John Doe", email="john@example.com", password=_BASE_HASH, hashed=True)
+
 
 class TestUser(unittest.TestCase):
-    def setUp(self):
-        self.user = User(name="John Doe", email="john@example.com", password="securepassword")
+    @classmethod
+    def setUpClass(cls):
+        # Tests only read the user; any test that changes it builds its own
+        cls.user = _make_user()
 
     def test_user_creation(self):
         self.assertEqual(self.user.name, "John Doe")
@@ -14,30 +52,58 @@ class TestUser(unittest.TestCase):
 
     def test_to_dict(self):
         user_dict = self.user.to_dict()
-        self.assertEqual(user_dict['name'], "John Doe")
-        self.assertEqual(user_dict['email'], "john@example.com")
-        self.assertIn('createdAt', user_dict)
+        self.assertEqual({key: user_dict[key] for key in EXPECTED_USER}, EXPECTED_USER)
+        self.assertIn('created_at', user_dict)
 
     def test_from_dict(self):
         user_data = {
             "name": "Jane Doe",
             "email": "jane@example.com",
             "password": "anotherpassword",
-            "createdAt": datetime.now().isoformat()
+            "created_at": _FIXED_ISO
         }
         user = User.from_dict(user_data)
         self.assertEqual(user.name, "Jane Doe")
         self.assertEqual(user.email, "jane@example.com")
 
-    def test_login_success(self):
+    def test_login(self):
         users = [self.user]
-        logged_in_user = User.login("john@example.com", "securepassword", users)
-        self.assertEqual(logged_in_user, self.user)
-
-    def test_login_failure(self):
-        users = [self.user]
-        logged_in_user = User.login("john@example.com", "wrongpassword", users)
-        self.assertIsNone(logged_in_user)
+        for email, password, expected in [
+            ("john@example.com", "securepassword", self.user),
+            ("john@example.com", "wrongpassword", None),
+        ]:
+            with self.subTest(email=email, password=password):
+                self.assertIs(User.login(email, password, users), expected)
+
+    def test_login_with_index(self):
+        users_by_email = {self.user.email: self.user}
+        self.assertEqual(User.login("john@example.com", "securepassword", users_by_email), self.user)
+        self.assertIsNone(User.login("john@example.com", "wrongpassword", users_by_email))
+        self.assertIsNone(User.login("jane@example.com", "securepassword", users_by_email))
+
+    def test_check_password_accepts_bytes(self):
+        self.assertTrue(self.user.check_password(b"securepassword"))
+        self.assertFalse(self.user.check_password(b"wrongpassword"))
+        user = _make_user()
+        user.password = User.hash_password("newpassword")
+        self.assertTrue(user.check_password("newpassword"))
+        self.assertTrue(self.user.check_password("securepassword"))
+
+    def test_check_password_rejects_malformed_hash(self):
+        user = User("Jane Doe", "jane@example.com", "not-a-bcrypt-hash", hashed=True)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertFalse(user.check_password("not-a-bcrypt-hash"))
+        self.assertIn("not a valid bcrypt hash", output.getvalue())
+
+    def test_set_cost(self):
+        self.addCleanup(User.set_cost, User._BCRYPT_COST)
+        User.set_cost(4)
+        hashed = User.hash_password("securepassword")
+        self.assertTrue(hashed.startswith("$2b$04$"))
+        # Hashes made at the old cost still verify
+        self.assertTrue(self.user.check_password("securepassword"))
+        with self.assertRaises(ValueError):
+            User.set_cost(3)
 
 class TestRestaurant(unittest.TestCase):
     def setUp(self):
@@ -53,8 +119,7 @@ class TestRestaurant(unittest.TestCase):
 
     def test_to_dict(self):
         restaurant_dict = self.restaurant.to_dict()
-        self.assertEqual(restaurant_dict['name'], "Pizza Place")
-        self.assertIn('menus', restaurant_dict)
+        self.assertEqual({key: restaurant_dict[key] for key in EXPECTED_RESTAURANT}, EXPECTED_RESTAURANT)
 
     def test_update_menu(self):
         new_menu = {"Veggie": 7.99}
@@ -65,16 +130,42 @@ class TestRestaurant(unittest.TestCase):
         self.restaurant.remove_menu("lunch")
         self.assertNotIn("lunch", self.restaurant.menus)
 
-    def test_display_info(self):
-        # This test would require capturing printed output, which can be done
-        # using unittest.mock or similar techniques. For simplicity, we skip it here.
-        pass
+    def test_price_items(self):
+        valid_items, total_price, missing = self.restaurant.price_items({"Margherita": 2, "Calzone": 1})
+        self.assertEqual(valid_items, {"Margherita": 2})
+        self.assertAlmostEqual(total_price, 17.98)
+        self.assertEqual(missing, ["Calzone"])
+
+    def test_prices_follow_menu_changes(self):
+        self.assertEqual(self.restaurant.prices["Margherita"], 8.99)
+        self.restaurant.update_menu("dinner", {"Margherita": 10.99, "Veggie": 7.99})
+        self.assertEqual(self.restaurant.prices["Margherita"], 8.99)
+        self.assertEqual(self.restaurant.prices["Veggie"], 7.99)
+        self.restaurant.remove_menu("lunch")
+        self.assertEqual(self.restaurant.prices["Margherita"], 10.99)
+        self.assertNotIn("Pepperoni", self.restaurant.prices)
+
+    def test_load_restaurants(self):
+        # Cover both the ijson streaming path and the bulk-parse fallback
+        for streaming in (app.ijson, None):
+            with self.subTest(streaming=streaming), patch("app.ijson", streaming), \
+                    tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "restaurants.json")
+                Restaurant.save_restaurants([self.restaurant, Restaurant("Burger Joint", {})], path)
+                loaded = Restaurant.load_restaurants(path)
+                self.assertEqual([r.name for r in loaded], ["Pizza Place", "Burger Joint"])
+                self.assertEqual(loaded[0].menus, self.restaurant.menus)
+
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write('[{"name": "Pizza Place", ')
+                self.assertEqual(Restaurant.load_restaurants(path), [])
 
 class TestOrder(unittest.TestCase):
-    def setUp(self):
-        # Create a User and Restaurant instance for testing
-        self.user = User(name="John Doe", email="john@example.com", password="securepassword")
-        self.restaurant = Restaurant(
+    @classmethod
+    def setUpClass(cls):
+        # Create a User and Restaurant instance for testing; no test modifies them
+        cls.user = _make_user()
+        cls.restaurant = Restaurant(
             name="Pizza Place",
             menus={
                 "lunch": {"Margherita": 8.99, "Pepperoni": 9.99},
@@ -82,6 +173,8 @@ class TestOrder(unittest.TestCase):
             },
             availability=True
         )
+
+    def setUp(self):
         self.items = {"Margherita": 2, "Pepperoni": 1}  # 2 Margheritas and 1 Pepperoni
         self.order = Order(user_email=self.user.email, restaurant_name=self.restaurant.name, items=self.items)
 
@@ -91,15 +184,11 @@ class TestOrder(unittest.TestCase):
         self.assertEqual(self.order.items, self.items)
         self.assertEqual(self.order.status, "pending")
         self.assertIsNone(self.order.driver_email)
-        self.assertTrue(isinstance(self.order.created_at, datetime))
+        self.assertTrue(isinstance(self.order.orderAt, datetime))
 
     def test_to_dict(self):
         order_dict = self.order.to_dict()
-        self.assertEqual(order_dict['user_email'], "john@example.com")
-        self.assertEqual(order_dict['restaurant_name'], "Pizza Place")
-        self.assertEqual(order_dict['items'], self.items)
-        self.assertEqual(order_dict['status'], "pending")
-        self.assertIsNone(order_dict['driver_email'])
+        self.assertEqual({key: order_dict[key] for key in EXPECTED_ORDER}, EXPECTED_ORDER)
         self.assertIn('orderAt', order_dict)
 
     def test_from_dict(self):
@@ -109,39 +198,69 @@ class TestOrder(unittest.TestCase):
             "items": {"Veggie": 1},
             "status": "pending",
             "driver_email": None,
-            "orderAt": datetime.now().isoformat()  # Ensure this key matches
+            "orderAt": _FIXED_ISO  # Ensure this key matches
         }
         order = Order.from_dict(order_data)
         self.assertEqual(order.user_email, "jane@example.com")
         self.assertEqual(order.restaurant_name, "Pizza Place")
         self.assertEqual(order.items, {"Veggie": 1})
-
+        self.assertEqual(order.to_dict()["orderAt"], _FIXED_ISO)
+        # Built at runtime so it is not the interned literal until from_dict interns it
+        order_data["status"] = "".join(["pend", "ing"])
+        self.assertIs(Order.from_dict(order_data).status, "pending")
+        first = Order.from_dict(dict(order_data, restaurant_name="".join(["Pizza ", "Place"])))
+        second = Order.from_dict(dict(order_data, restaurant_name="".join(["Pizza ", "Place"])))
+        self.assertIs(first.restaurant_name, second.restaurant_name)
+
+    @unittest.skipIf(COMPILED, "mypyc enforces the str annotations at runtime")
+    def test_from_dict_with_null_fields(self):
+        # Null values load as before rather than failing in sys.intern
+        order = Order.from_dict({"user_email": None, "restaurant_name": None, "items": {},
+                                 "status": None, "orderAt": _FIXED_ISO})
+        self.assertEqual((order.user_email, order.restaurant_name, order.status), (None, None, None))
+
+    def test_round_trip(self):
+        for status, driver_email in [("pending", None), ("assigned", "driver@example.com")]:
+            with self.subTest(status=status):
+                order = Order(self.user.email, self.restaurant.name, self.items, status, driver_email)
+                loaded = Order.from_dict(order.to_dict())
+                self.assertEqual(loaded.status, status)
+                self.assertEqual(loaded.driver_email, driver_email)
+                self.assertEqual(loaded.items, self.items)
+                self.assertEqual(loaded.orderAt, order.orderAt)
 
     def test_update_status(self):
         new_status = "completed"
         updated_status = self.order.update_status(new_status)
-        self.assertEqual(updated_status, new_status)
+        self.assertEqual(updated_status, f"Order status updated to: {new_status}")
         self.assertEqual(self.order.status, new_status)
 
     def test_display_receipt(self):
         # Capture printed output
-        from unittest.mock import patch
-        with patch('builtins.print') as mocked_print:
+        with contextlib.redirect_stdout(io.StringIO()) as output:
             self.order.display_receipt(self.user, self.restaurant)
-            mocked_print.assert_any_call(" - Margherita: 2 x $8.99 = $17.98")
-            mocked_print.assert_any_call(" - Pepperoni: 1 x $9.99 = $9.99")
-            mocked_print.assert_any_call("Total: $27.97")
-            mocked_print.assert_any_call("Status: pending")
+        text = output.getvalue()
+        self.assertIn(" - Margherita: 2 x $8.99 = $17.98", text)
+        self.assertIn(" - Pepperoni: 1 x $9.99 = $9.99", text)
+        self.assertIn("Total: $27.97", text)
+        self.assertIn("Status: Pending", text)
 
 
 class TestDriver(unittest.TestCase):
     def setUp(self):
         # Create a driver for testing
         self.driver = Driver(name="John Doe", email="johndoe@gmail.com")
-        self.order1 = Order(user_email="user1@example.com", restaurant_name="Pizza Place",
-                            items={"Margherita": 2}, status="pending")
-        self.order2 = Order(user_email="user2@example.com", restaurant_name="Burger Joint",
-                            items={"Cheeseburger": 1}, status="pending")
+
+    # Each test runs on a fresh TestCase instance, so these are built only by tests that use them
+    @cached_property
+    def order1(self):
+        return Order(user_email="user1@example.com", restaurant_name="Pizza Place",
+                     items={"Margherita": 2}, status="pending")
+
+    @cached_property
+    def order2(self):
+        return Order(user_email="user2@example.com", restaurant_name="Burger Joint",
+                     items={"Cheeseburger": 1}, status="pending")
 
     def test_driver_creation(self):
         self.assertEqual(self.driver.name, "John Doe")
@@ -150,11 +269,15 @@ class TestDriver(unittest.TestCase):
         self.assertEqual(len(self.driver.orders), 0)
 
     def test_to_dict(self):
+        self.assertEqual(self.driver.to_dict(), EXPECTED_DRIVER)
+
+    def test_round_trip_with_orders(self):
+        self.driver.assign_order(self.order1)
         driver_dict = self.driver.to_dict()
-        self.assertEqual(driver_dict['name'], "John Doe")
-        self.assertEqual(driver_dict['email'], "johndoe@gmail.com")
-        self.assertTrue(driver_dict['available'])
-        self.assertEqual(driver_dict['orders'], [])
+        self.assertEqual(driver_dict["orders"], [self.order1.to_dict()])
+        # The dict must be plain JSON data, not models
+        loaded = Driver.from_dict(json.loads(json.dumps(driver_dict)))
+        self.assertEqual(loaded.to_dict(), driver_dict)
 
     def test_from_dict(self):
         driver_data = {
@@ -171,22 +294,19 @@ class TestDriver(unittest.TestCase):
 
     def test_assign_order(self):
         self.driver.assign_order(self.order1)
-        self.assertFalse(self.driver.available)
-        self.assertEqual(len(self.driver.orders), 1)
-        self.assertEqual(self.driver.orders[0], self.order1)
-        self.assertEqual(self.order1.status, "Assigned")
-
-        # Try to assign another order when the driver is not available
+        # Try to assign another order when the driver is not available; nothing should change
         self.driver.assign_order(self.order2)
-        self.assertEqual(len(self.driver.orders), 1)  # Should not change
-        self.assertEqual(self.order1.status, "Assigned")  # Status should remain unchanged
+        self.assertEqual(
+            (self.driver.available, self.driver.orders, self.order1.status, self.order2.status),
+            (False, [self.order1], "assigned", "pending"),
+        )
 
     def test_complete_order(self):
         self.driver.assign_order(self.order1)
         self.driver.complete_order()
         self.assertTrue(self.driver.available)
         self.assertEqual(len(self.driver.orders), 0)
-        self.assertEqual(self.order1.status, "Delivered")
+        self.assertEqual(self.order1.status, "delivered")
 
         # Try to complete an order when there are no orders
         self.driver.complete_order()  # Should print a message about no orders
@@ -194,23 +314,236 @@ class TestDriver(unittest.TestCase):
     def test_save_driver(self):
         self.driver.assign_order(self.order1)
         drivers = [self.driver]
-        Driver.save_driver(drivers, 'test_driver.json')
+        # A private temp directory keeps parallel runs from sharing one file and cleans itself up
+        with tempfile.TemporaryDirectory() as tmp:
+            file_name = os.path.join(tmp, 'test_driver.json')
+            Driver.save_driver(drivers, file_name)
 
-        # Load the driver back from the file
-        loaded_drivers = Driver.load_driver('test_driver.json')
+            # Load the driver back from the file
+            loaded_drivers = Driver.load_driver(file_name)
         self.assertEqual(len(loaded_drivers), 1)
         self.assertEqual(loaded_drivers[0].name, "John Doe")
         self.assertEqual(loaded_drivers[0].email, "johndoe@gmail.com")
         self.assertEqual(len(loaded_drivers[0].orders), 1)
         self.assertEqual(loaded_drivers[0].orders[0].user_email, "user1@example.com")
 
-    def tearDown(self):
-        import os
-        # Clean up the test file if it exists
-        if os.path.exists('test_driver.json'):
-            os.remove('test_driver.json')
 
-        
+class TestAdmin(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Users added by the tests themselves only need a valid hash, not a slow one
+        cls.addClassCleanup(User.set_cost, User._BCRYPT_COST)
+        User.set_cost(4)
+
+    def setUp(self):
+        self.admin = Admin()
+        user = _make_user()
+        self.admin.users.append(user)
+        self.admin.users_by_email[user.email] = user
+        self.admin.add_restaurant("Pizza Place", {"lunch": {"Margherita": 8.99}})
+        self.admin.add_driver("Jane Doe", "janedoe@gmail.com")
+
+    def test_login_uses_index(self):
+        user = self.admin.users_by_email["john@example.com"]
+        self.assertIs(self.admin.login("john@example.com", "securepassword"), user)
+        self.assertIsNone(self.admin.login("john@example.com", "wrongpassword"))
+        self.assertIsNone(self.admin.login("nobody@example.com", "securepassword"))
+
+    def test_duplicates_rejected(self):
+        self.admin.add_user("John Again", "john@example.com", "otherpassword")
+        self.admin.add_restaurant("Pizza Place", {})
+        self.admin.add_driver("Jane Again", "janedoe@gmail.com")
+        self.assertEqual(len(self.admin.users), 1)
+        self.assertEqual(len(self.admin.restaurants), 1)
+        self.assertEqual(len(self.admin.drivers), 1)
+
+    def test_remove_restaurant(self):
+        self.admin.remove_restaurant("Pizza Place")
+        self.assertNotIn("Pizza Place", self.admin.restaurants_by_name)
+        self.assertEqual(self.admin.restaurants, [])
+
+    def test_place_order_unavailable_restaurant(self):
+        self.admin.update_availability("Pizza Place", False)
+        self.admin.place_order("john@example.com", "Pizza Place", {"Margherita": 1})
+        self.assertEqual(self.admin.orders, [])
+
+    def test_place_order_skips_unknown_items(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            order = self.admin.place_order("john@example.com", "Pizza Place",
+                                           {"Margherita": 2, "Calzone": 1})
+        self.assertEqual(order.items, {"Margherita": 2})
+        self.assertIn("Item 'Calzone' not found", output.getvalue())
+        self.assertIn("Total: $17.98", output.getvalue())
+
+    def test_list_restaurants_cache(self):
+        def listing():
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                self.admin.list_restaurants()
+            return output.getvalue()
+
+        first = listing()
+        self.assertIn("Margherita: $8.99", first)
+        self.assertEqual(listing(), first)
+        self.admin.update_availability("Pizza Place", False)
+        self.assertIn("Closed", listing())
+        self.admin.update_restaurant_menu("Pizza Place", "lunch", {"Calzone": 10.5})
+        self.assertIn("Calzone: $10.50", listing())
+
+        # Changes made on the restaurant itself, not through Admin, must show up too
+        restaurant = self.admin.restaurants_by_name["Pizza Place"]
+        restaurant.availability = True
+        self.assertIn("Open", listing())
+        restaurant.update_menu("dinner", {"Lasagne": 11.0})
+        self.assertIn("Lasagne: $11.00", listing())
+        restaurant.remove_menu("lunch")
+        self.assertNotIn("Calzone", listing())
+
+    def test_parse_cli_input(self):
+        self.assertEqual(app._parse_items('{"Margherita": 2}'), {"Margherita": 2})
+        self.assertEqual(app._parse_menus('{"lunch": {"Margherita": 9}}'), {"lunch": {"Margherita": 9.0}})
+        for parse, raw in [(app._parse_items, '{"Margherita": "2"}'),
+                           (app._parse_items, '{"Margherita": 0}'),
+                           (app._parse_items, '["Margherita"]'),
+                           (app._parse_items, '{"Margherita": 2'),
+                           (app._parse_menus, '{"lunch": {"Margherita": true}}'),
+                           (app._parse_menus, '{"lunch": 8.99}')]:
+            with self.subTest(raw=raw), self.assertRaises(ValueError):
+                parse(raw)
+
+    def test_assign_order_queues(self):
+        self.admin.place_order("john@example.com", "Pizza Place", {"Margherita": 1})
+        self.admin.place_order("john@example.com", "Pizza Place", {"Margherita": 2})
+        self.admin.assign_order_to_driver()
+        first, second = self.admin.orders
+        self.assertEqual(first.driver_email, "janedoe@gmail.com")
+        self.assertEqual(self.admin.orders_by_user["john@example.com"], [first, second])
+        self.assertEqual(list(self.admin.pending_orders), [second])
+        self.assertEqual(len(self.admin.available_drivers), 0)
+
+        self.admin.complete_order("janedoe@gmail.com")
+        self.assertEqual(len(self.admin.available_drivers), 1)
+        self.admin.assign_order_to_driver()
+        self.assertEqual(second.driver_email, "janedoe@gmail.com")
+        self.assertEqual(len(self.admin.pending_orders), 0)
+
+    def test_assign_order_skips_stale_queue_entries(self):
+        driver = self.admin.drivers_by_email["janedoe@gmail.com"]
+        self.admin.place_order("john@example.com", "Pizza Place", {"Margherita": 1})
+        # Made busy behind the admin's back, so its queue entry is stale
+        driver.assign_order(Order("john@example.com", "Pizza Place", {"Margherita": 1}))
+        self.assertEqual(self.admin.assign_order_to_driver(), 0)
+        self.assertEqual(len(self.admin.available_drivers), 0)
+        self.assertEqual(len(self.admin.pending_orders), 1)
+
+    def test_save_and_load_data(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            files = {
+                "user_file": os.path.join(tmp, "users.json"),
+                "restaurant_file": os.path.join(tmp, "restaurants.json"),
+                "order_file": os.path.join(tmp, "orders.json"),
+                "driver_file": os.path.join(tmp, "drivers.json"),
+            }
+            self.admin.place_order("john@example.com", "Pizza Place", {"Margherita": 1})
+            self.admin.save_data(**files)
+
+            loaded = Admin()
+            loaded.load_data(**files)
+            self.assertEqual(sorted(os.listdir(tmp)),
+                             ["drivers.json", "orders.json", "restaurants.json", "users.json"])
+        self.assertEqual([u.email for u in loaded.users], ["john@example.com"])
+        self.assertIn("Pizza Place", loaded.restaurants_by_name)
+        self.assertEqual(len(loaded.pending_orders), 1)
+        self.assertEqual(len(loaded.available_drivers), 1)
+
+    def test_failed_save_leaves_no_temp_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "users.json")
+            with patch("app.os.replace", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    app._atomic_write(path, b"[]")
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_save_data_skips_unchanged_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            files = {
+                "user_file": os.path.join(tmp, "users.json"),
+                "restaurant_file": os.path.join(tmp, "restaurants.json"),
+                "order_file": os.path.join(tmp, "orders.json"),
+                "driver_file": os.path.join(tmp, "drivers.json"),
+            }
+            self.admin.place_order("john@example.com", "Pizza Place", {"Margherita": 1})
+            self.admin.save_data(**files)
+
+            def written():
+                # Every write ends in os.replace(tmp, path); patching it also works on a mypyc build
+                with patch("app.os.replace", wraps=os.replace) as replace:
+                    self.admin.save_data(**files)
+                return {call.args[1] for call in replace.call_args_list}
+
+            self.admin.add_driver("Sam", "sam@gmail.com")
+            self.assertEqual(written(), {files["driver_file"]})
+            self.assertEqual(written(), set())
+
+            # Changes made on the models themselves are saved too
+            self.admin.restaurants_by_name["Pizza Place"].remove_menu("lunch")
+            self.admin.orders[0].update_status("delivered")
+            self.assertEqual(written(), {files["restaurant_file"], files["order_file"]})
+            with open(files["restaurant_file"], encoding="utf-8") as f:
+                self.assertNotIn("lunch", f.read())
+
+            # A file removed behind our back is written again
+            os.remove(files["user_file"])
+            self.assertEqual(written(), {files["user_file"]})
+
+            loaded = Admin()
+            loaded.load_data(**files)
+            loaded.users[0].name = "Johnny"
+            loaded.save_data(**files)
+            with open(files["user_file"], encoding="utf-8") as f:
+                self.assertIn("Johnny", f.read())
+
+    def test_quiet_mode_returns_results(self):
+        out = io.StringIO()
+        with patch("app.QUIET", True), contextlib.redirect_stdout(out):
+            driver = self.admin.add_driver("Sam", "sam@gmail.com")
+            duplicate = self.admin.add_driver("Sam", "sam@gmail.com")
+            order = self.admin.place_order("john@example.com", "Pizza Place", {"Margherita": 2})
+            assigned = self.admin.assign_order_to_driver()
+        self.assertEqual(out.getvalue(), "")
+        self.assertIs(self.admin.drivers_by_email["sam@gmail.com"], driver)
+        self.assertIsNone(duplicate)
+        self.assertEqual(order.items, {"Margherita": 2})
+        self.assertEqual(assigned, 1)
+
+    def test_add_users_bulk(self):
+        added = self.admin.add_users_bulk([
+            ("Jane Doe", "jane@example.com", "janepassword"),
+            ("John Again", "john@example.com", "otherpassword"),
+            ("Jane Again", "jane@example.com", "otherpassword"),
+            ("Sam", "sam@example.com", "sampassword"),
+        ])
+        self.assertEqual([u.email for u in added], ["jane@example.com", "sam@example.com"])
+        self.assertEqual(len(self.admin.users), 3)
+        self.assertIs(self.admin.login("sam@example.com", "sampassword"), added[1])
+        self.assertIsNone(self.admin.login("jane@example.com", "otherpassword"))
+
+    def test_add_user_async(self):
+        async def signup():
+            return await asyncio.gather(
+                self.admin.add_user_async("Jane Doe", "jane@example.com", "janepassword"),
+                self.admin.add_user_async("Jane Again", "jane@example.com", "otherpassword"),
+            )
+        first, second = asyncio.run(signup())
+        self.assertIsNone(second)
+        self.assertIs(self.admin.login("jane@example.com", "janepassword"), first)
+        self.assertEqual(len(self.admin.users), 2)
+
+    def test_rebuild_indexes(self):
+        self.admin.users_by_email = {}
+        self.admin.rebuild_indexes()
+        self.assertIn("john@example.com", self.admin.users_by_email)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file